@@ -15,6 +15,14 @@ from rich import box
 from rich.console import Console
 
 VERSION = "3.1.10"
+CONFIRMATION_ANSWERS = frozenset({"y", "yes", "Y"})
+
+# rich markup used in the info tables
+RUNNING_STATE = "[green]running[/green]"
+IMAGE_UP_TO_DATE = "remote ([green]up to date[/green], {})"
+IMAGE_DEPRECATED = "remote ([orange3]deprecated[/orange3], {})"
+IMAGE_DISCONTINUED = "remote ([bright_black]discontinued[/bright_black])"
+IMAGE_NOT_INSTALLED = "remote ([yellow3]not installed[/yellow3], {})"
 
 '''
 # TODO :
@@ -32,33 +40,42 @@ VERSION = "3.1.10"
 
 
 class Logger:
+    __slots__ = ("verbosity", "quiet")
+
+    DEBUG_PREFIX = "[yellow3][DEBUG][/yellow3] "
+    VERBOSE_PREFIX = "[blue][VERBOSE][/blue] "
+    INFO_PREFIX = "[bold blue][*][/bold blue] "
+    SUCCESS_PREFIX = "[bold green][+][/bold green] "
+    WARNING_PREFIX = "[bold orange3][-][/bold orange3] "
+    ERROR_PREFIX = "[bold red][!][/bold red] "
+
     def __init__(self, verbosity=0, quiet=False):
         self.verbosity = verbosity
         self.quiet = quiet
 
     def debug(self, message):
         if self.verbosity == 2:
-            console.print("{}[DEBUG]{} {}".format("[yellow3]", "[/yellow3]", message), highlight=False)
+            console.print(self.DEBUG_PREFIX + str(message), highlight=False)
 
     def verbose(self, message):
         if self.verbosity >= 1:
-            console.print("{}[VERBOSE]{} {}".format("[blue]", "[/blue]", message), highlight=False)
+            console.print(self.VERBOSE_PREFIX + str(message), highlight=False)
 
     def info(self, message):
         if not self.quiet:
-            console.print("{}[*]{} {}".format("[bold blue]", "[/bold blue]", message), highlight=False)
+            console.print(self.INFO_PREFIX + str(message), highlight=False)
 
     def success(self, message):
         if not self.quiet:
-            console.print("{}[+]{} {}".format("[bold green]", "[/bold green]", message), highlight=False)
+            console.print(self.SUCCESS_PREFIX + str(message), highlight=False)
 
     def warning(self, message):
         if not self.quiet:
-            console.print("{}[-]{} {}".format("[bold orange3]", "[/bold orange3]", message), highlight=False)
+            console.print(self.WARNING_PREFIX + str(message), highlight=False)
 
     def error(self, message):
         if not self.quiet:
-            console.print("{}[!]{} {}".format("[bold red]", "[/bold red]", message), highlight=False)
+            console.print(self.ERROR_PREFIX + str(message), highlight=False)
 
     def raw(self, message):
         if not self.quiet:
@@ -82,9 +99,9 @@ def get_options():
         "use an Crazyradio PA": "exegol --device /dev/bus/usb/ start",
     }
 
-    epilog = "{}Examples:{}\n".format(GREEN, END)
-    for example in examples.keys():
-        epilog += "  {}\t{}\n".format(example, examples[example])
+    epilog = "{}Examples:{}\n".format(GREEN, END) + "".join(
+        "  {}\t{}\n".format(example, examples[example]) for example in examples.keys()
+    )
 
     actions = {
         "start": "automatically start, resume, create or enter an Exegol container",
@@ -97,9 +114,7 @@ def get_options():
         "version": "print current version",
     }
 
-    actions_help = ""
-    for action in actions.keys():
-        actions_help += "{}\t\t{}\n".format(action, actions[action])
+    actions_help = "".join("{}\t\t{}\n".format(action, actions[action]) for action in actions.keys())
 
     modes = {
         "release": "(default) downloads a pre-built image (from DockerHub) (faster)",
@@ -108,9 +123,7 @@ def get_options():
         )
     }
 
-    modes_help = ""
-    for mode in modes.keys():
-        modes_help += "{}\t\t{}\n".format(mode, modes[mode])
+    modes_help = "".join("{}\t\t{}\n".format(mode, modes[mode]) for mode in modes.keys())
 
     parser = argparse.ArgumentParser(
         description=description,
@@ -274,11 +287,15 @@ def get_options():
     return options
 
 
+# docker's name filter is a substring/regex match, keep only the containers whose name is an exact match
+def get_containers(containertag):
+    name = "exegol-" + containertag
+    return [container for container in client.containers.list(all=True, filters={"name": name})
+            if container.name == name]
+
+
 def container_exists(containertag):
-    containers = client.containers.list(all=True, filters={"name": "exegol-" + containertag})
-    for container in containers:
-        if not container.name == "exegol-" + containertag:
-            containers.remove(container)
+    containers = get_containers(containertag)
     logger.debug("Containers with name {}: {}".format("exegol-" + containertag, str(len(containers))))
     if len(containers) > 1:
         logger.error("Something's wrong, you shouldn't have multiple containers with the same name...")
@@ -287,44 +304,78 @@ def container_exists(containertag):
         return bool(len(containers))
 
 
+def get_container_envs(env_list):
+    envs = {}
+    for env in env_list or []:
+        key, _, value = env.partition("=")
+        envs[key.strip("\"'")] = value
+    return envs
+
+
 def was_created_with_gui(container):
+    attrs = container.attrs
     logger.debug(
-        "Looking for the {} in the container {}".format("'DISPLAY' environment variable", container.attrs["Name"]))
-    container_info = container.attrs
-    for var in container_info["Config"]["Env"]:
-        if "DISPLAY" in var:
-            return True
-    return False
+        "Looking for the {} in the container {}".format("'DISPLAY' environment variable", attrs["Name"]))
+    return "DISPLAY" in get_container_envs(attrs["Config"]["Env"])
+
+
+# Returns (host source, display string) pairs for the binds and mounts of a container
+def get_container_volumes(host_config):
+    volumes = []
+    if host_config.get("Binds"):
+        for bind in host_config["Binds"]:
+            volumes.append((bind.partition(":")[0], bind.replace(":", " ↔ ")))
+    if host_config.get("Mounts"):
+        for mount in host_config["Mounts"]:
+            source = mount["VolumeOptions"]["DriverConfig"]["Options"]["device"]
+            volumes.append((source, source + " ↔ " + mount["Target"]))
+    return volumes
 
 
 def was_created_with_privileged(container):
-    logger.debug("Looking for the {} in the container {}".format("'Privileged' attribute", container.attrs["Name"]))
-    return container.attrs["HostConfig"]["Privileged"]
+    attrs = container.attrs
+    logger.debug("Looking for the {} in the container {}".format("'Privileged' attribute", attrs["Name"]))
+    return attrs["HostConfig"]["Privileged"]
+
+
+# Returns the devices shared with a container, indexed by their path on the host
+def get_container_devices(host_config):
+    devices = {}
+    for device in host_config["Devices"] or []:
+        devices[device["PathOnHost"]] = device["PathInContainer"]
+    return devices
 
 
 def was_created_with_device(container):
-    logger.debug("Looking for the {} in the container {}".format("'Devices' attribute", container.attrs["Name"]))
-    if container.attrs["HostConfig"]["Devices"]:
-        return container.attrs["HostConfig"]["Devices"][0]["PathOnHost"]
+    attrs = container.attrs
+    logger.debug("Looking for the {} in the container {}".format("'Devices' attribute", attrs["Name"]))
+    devices = attrs["HostConfig"]["Devices"]
+    if devices:
+        return devices[0]["PathOnHost"]
     else:
         return False
 
 
 def was_created_with_host_networking(container):
+    attrs = container.attrs
     logger.debug("Looking for the {} in the container {}".format("'host' value in the 'Networks' attribute",
-                                                                 container.attrs["Name"]))
-    return ("host" in container.attrs["NetworkSettings"]["Networks"])
+                                                                 attrs["Name"]))
+    return ("host" in attrs["NetworkSettings"].get("Networks", {}))
 
 
 def container_analysis(container):
-    if was_created_with_device(container):
-        if options.device and options.device != was_created_with_device(container):
+    attrs = container.attrs
+    logger.debug("Looking for the {} in the container {}".format("'Devices' attribute", attrs["Name"]))
+    devices = get_container_devices(attrs["HostConfig"])
+    if devices:
+        if options.device and options.device not in devices:
             logger.warning(
                 "Container was created with another shared device ({}), you need to reset it and start it with the -d/--device option, and the name of the device, for it to be taken into account".format(
-                    was_created_with_device(container)))
+                    ", ".join(devices)))
         else:
             logger.verbose(
-                "Container was created with host device ({}) sharing".format(was_created_with_device(container)))
+                "Container was created with host device ({}) sharing".format(
+                    ", ".join("{} ↔ {}".format(host, target) for host, target in devices.items())))
     elif options.device:
         logger.warning(
             "Container was created with no device sharing, you need to reset it and start it with the -d/--device option, and the name of the device, for it to be taken into account"
@@ -354,52 +405,59 @@ def container_analysis(container):
 
 
 def container_creation_options(containertag):
-    base_options = ""
-    advanced_options = ""
+    advanced_options = []
     if options.X11:
         logger.verbose("Enabling display sharing")
-        advanced_options += " --env DISPLAY=unix{}".format(os.getenv("DISPLAY"))
-        advanced_options += " --volume /tmp/.X11-unix:/tmp/.X11-unix"
-        advanced_options += ' --env="QT_X11_NO_MITSHM=1"'
+        advanced_options.extend([
+            "--env DISPLAY=unix{}".format(os.getenv("DISPLAY")),
+            "--volume /tmp/.X11-unix:/tmp/.X11-unix",
+            '--env="QT_X11_NO_MITSHM=1"',
+        ])
     if options.host_timezones:
         logger.verbose("Enabling host timezones")
-        advanced_options += " --volume /etc/timezone:/etc/timezone:ro"
-        advanced_options += " --volume /etc/localtime:/etc/localtime:ro"
+        advanced_options.extend([
+            "--volume /etc/timezone:/etc/timezone:ro",
+            "--volume /etc/localtime:/etc/localtime:ro",
+        ])
     if options.host_network:
         logger.verbose("Enabling host networking")
-        advanced_options += " --network host"
+        advanced_options.append("--network host")
     if options.bind_resources:
         # TODO: find a solution for this, if two containers have differents resources, when I boot container A and B, B's resources will be overwriten with A's
         logger.verbose("Sharing /opt/resources (container) ↔ {} (host)".format(SHARED_RESOURCES))
         if not os.path.isdir(SHARED_RESOURCES):
             logger.debug("Host directory {} doesn\'t exist. Creating it...".format(SHARED_RESOURCES))
             os.mkdir(SHARED_RESOURCES)
-        advanced_options += ' --mount '
-        advanced_options += 'type=volume,'
-        advanced_options += 'dst=/opt/resources,'
-        advanced_options += 'volume-driver=local,'
-        advanced_options += 'volume-opt=type=none,'
-        advanced_options += 'volume-opt=o=bind,'
-        advanced_options += 'volume-opt=device={}'.format(SHARED_RESOURCES)
+        advanced_options.append("--mount " + ",".join([
+            "type=volume",
+            "dst=/opt/resources",
+            "volume-driver=local",
+            "volume-opt=type=none",
+            "volume-opt=o=bind",
+            "volume-opt=device={}".format(SHARED_RESOURCES),
+        ]))
     if options.privileged:
         logger.warning("Enabling extended privileges")
-        advanced_options += " --privileged"
+        advanced_options.append("--privileged")
     if options.device:
         logger.verbose("Enabling host device ({}) sharing".format(options.device))
-        advanced_options += " --device {}".format(options.device)
+        advanced_options.append("--device {}".format(options.device))
     if options.mount_current_dir:
-        logger.verbose("Sharing /workspace (container) ↔ {} (host)".format(os.getcwd()))
-        advanced_options += " --volume {}:/workspace".format(os.getcwd())
+        cwd = os.getcwd()
+        logger.verbose("Sharing /workspace (container) ↔ {} (host)".format(cwd))
+        advanced_options.append("--volume {}:/workspace".format(cwd))
     if options.custom_options:
         logger.verbose("Specifying custom options: {}".format(options.custom_options))
-        advanced_options += " " + options.custom_options
-    base_options += " --interactive"
-    base_options += " --tty"
-    # base_options += ' --detach'
-    base_options += " --volume {}:/data".format(SHARED_DATA_VOLUMES + "/" + containertag)
-    base_options += " --name {}".format("exegol-" + containertag)
-    base_options += " --hostname {}".format("exegol-" + containertag)
-    return base_options, advanced_options
+        advanced_options.append(options.custom_options)
+    base_options = [
+        "--interactive",
+        "--tty",
+        # "--detach",
+        "--volume {}:/data".format(SHARED_DATA_VOLUMES + "/" + containertag),
+        "--name {}".format("exegol-" + containertag),
+        "--hostname {}".format("exegol-" + containertag),
+    ]
+    return "".join(" " + option for option in base_options), "".join(" " + option for option in advanced_options)
 
 
 # Exec command on host with output being printed with logger.debug() or logger.error()
@@ -455,14 +513,15 @@ def select_containertag(local_git_branch):
     if not len_containers == 0:
         finished_at = ""
         for container in containers:
-            logger.debug("└── " + str(container.attrs["Name"]) + " → " + str(container.attrs["State"]["FinishedAt"]))
-            this_finished_at = parser.parse(container.attrs["State"]["FinishedAt"])
+            attrs = container.attrs
+            logger.debug("└── " + str(attrs["Name"]) + " → " + str(attrs["State"]["FinishedAt"]))
+            this_finished_at = parser.parse(attrs["State"]["FinishedAt"])
             if finished_at:
                 if this_finished_at >= finished_at:
                     finished_at = this_finished_at
-                    last_used_container_tag = container.attrs["Name"].replace('/exegol-', '')
+                    last_used_container_tag = attrs["Name"].replace('/exegol-', '')
             else:
-                last_used_container_tag = container.attrs["Name"].replace('/exegol-', '')
+                last_used_container_tag = attrs["Name"].replace('/exegol-', '')
                 finished_at = this_finished_at
         logger.debug("Last created container: {}".format(last_used_container_tag))
     if last_used_container_tag:
@@ -471,18 +530,15 @@ def select_containertag(local_git_branch):
     # default to container that has the local dir mounted as volume
     logger.debug("Fetching volumes for each container")
     cwd_in_vol_container = ""
+    cwd = os.getcwd()
     if not len_containers == 0:
         for container in containers:
-            volumes = []
-            if container.attrs["HostConfig"].get("Binds"):
-                for bind in container.attrs["HostConfig"]["Binds"]:
-                    volumes.append(bind.split(":")[0])
-            if container.attrs["HostConfig"].get("Mounts"):
-                for mount in container.attrs["HostConfig"]["Mounts"]:
-                    volumes.append(mount["VolumeOptions"]["DriverConfig"]["Options"]["device"])
-            logger.debug("└── " + str(container.attrs["Name"]) + " → " + str(volumes))
-            if os.getcwd() in volumes:
-                cwd_in_vol_container = container.attrs["Name"].replace('/exegol-', '')
+            attrs = container.attrs
+            name = attrs["Name"]
+            volumes = [source for source, _ in get_container_volumes(attrs["HostConfig"])]
+            logger.debug("└── " + str(name) + " → " + str(volumes))
+            if cwd in volumes:
+                cwd_in_vol_container = name.replace('/exegol-', '')
                 logger.debug("Current dir is in volumes of container: {}".format(cwd_in_vol_container))
     if cwd_in_vol_container:
         default_containertag = cwd_in_vol_container
@@ -523,11 +579,7 @@ def start():
         if container_exists(options.containertag):
             if LOOP_PREVENTION == "" or LOOP_PREVENTION == "create":
                 logger.success("Container exists")
-            containers = client.containers.list(all=True, filters={"name": "exegol-" + options.containertag})
-            for container in containers:
-                if not container.name == "exegol-" + options.containertag:
-                    containers.remove(container)
-            container = containers[0]
+            container = get_containers(options.containertag)[0]
             if container.attrs["State"]["Status"] == "running":
                 if LOOP_PREVENTION == "exec":
                     logger.debug("Loop prevention triggered")
@@ -537,13 +589,7 @@ def start():
                     container_analysis(container)
                     if was_created_with_gui(container):
                         logger.info("Running xhost command for display sharing")
-                        exec_popen(
-                            "xhost +local:{}".format(
-                                client.api.inspect_container("exegol-" + options.containertag)["Config"][
-                                    "Hostname"
-                                ]
-                            )
-                        )
+                        exec_popen("xhost +local:{}".format(container.attrs["Config"]["Hostname"]))
                     if options.exec is None:
                         logger.info("Entering Exegol")
                         exec_system("docker exec -ti {} {}".format("exegol-" + options.containertag, options.shell))
@@ -577,15 +623,11 @@ def start():
             else:
                 logger.warning("Container does not exist")
                 info_images()
-                if LOCAL_GIT_BRANCH == "master":  # TODO: fix this crap when I'll have branch names that are equal to docker tags
-                    default_dockertag = "stable"
-                else:
-                    default_dockertag = LOCAL_GIT_BRANCH
                 imagetag = input(
                     "{}[?]{} What image do you want the container to create to be based upon [default: {}]? ".format(
-                        BOLD_BLUE, END, default_dockertag))
+                        BOLD_BLUE, END, DEFAULT_DOCKERTAG))
                 if not imagetag:
-                    imagetag = default_dockertag
+                    imagetag = DEFAULT_DOCKERTAG
                 if client.images.list(IMAGE_NAME + ":" + imagetag):
                     info_containers()
                     if options.containertag:
@@ -626,7 +668,7 @@ def start():
                     BOLD_ORANGE, END
                 )
             )
-            if confirmation == "y" or confirmation == "yes" or confirmation == "Y":
+            if confirmation in CONFIRMATION_ANSWERS:
                 install()
                 LOOP_PREVENTION = "install"
                 start()
@@ -635,20 +677,12 @@ def start():
 def stop():
     if not options.containertag:
         select_containertag(LOCAL_GIT_BRANCH)
-    containers = client.containers.list(all=True, filters={"name": "exegol-" + options.containertag})
-    for container in containers:
-        if not container.name == "exegol-" + options.containertag:
-            containers.remove(container)
-    container = containers[0]
+    container = get_containers(options.containertag)[0]
     if container.attrs["State"]["Status"] == "running":
         logger.info("Container is up")
         logger.info("Stopping container")
         exec_popen("docker stop --time 3 {}".format("exegol-" + options.containertag))
-        containers = client.containers.list(all=True, filters={"name": "exegol-" + options.containertag})
-        for container in containers:
-            if not container.name == "exegol-" + options.containertag:
-                containers.remove(container)
-        container = containers[0]
+        container = get_containers(options.containertag)[0]
         if container.attrs["State"]["Status"] == "running":
             logger.error("Container is still up, something went wrong...")
         else:
@@ -696,15 +730,11 @@ def remove_container():
 def install():
     info_images()
     if options.mode == "release":
-        if LOCAL_GIT_BRANCH == "master":  # TODO: fix this crap when I'll have branch names that are equal to docker tags
-            default_dockertag = "stable"
-        else:
-            default_dockertag = LOCAL_GIT_BRANCH
         dockertag = input(
             "{}[?]{} What remote image (tag) do you want to install/update [default: {}]? ".format(BOLD_BLUE, END,
-                                                                                                   default_dockertag))
+                                                                                                   DEFAULT_DOCKERTAG))
         if dockertag == "":
-            dockertag = default_dockertag
+            dockertag = DEFAULT_DOCKERTAG
         logger.debug("Fetching DockerHub images tags")
         remote_image_tags = []
         remote_images_request = requests.get(url="https://hub.docker.com/v2/repositories/{}/tags".format(IMAGE_NAME), verify=options.verify)
@@ -776,7 +806,7 @@ def remove_image():
             confirmation = input(
                 "{}[?]{} Are you sure you want to do this? [y/N] ".format(BOLD_ORANGE, END)
             )
-            if confirmation == "y" or confirmation == "yes" or confirmation == "Y":
+            if confirmation in CONFIRMATION_ANSWERS:
                 logger.info("Deletion confirmed, proceeding")
                 logger.info("Deleting image {}".format(IMAGE_NAME + ":" + imagetag))
                 exec_system("docker image rm {}".format(IMAGE_NAME + ":" + imagetag))
@@ -793,10 +823,10 @@ def remove_image():
 def remove():
     # TODO: this needs to be improved to have the possibility to remove files, networks and so on related to Exegol,
     #  and improve for simultaneous multiple removals
-    to_remove = input("{}[?]{} Do you want to remove container(s) or image(s) [C/i]? ".format(BOLD_BLUE, END))
-    if to_remove.lower() == "c" or not to_remove:
+    to_remove = input("{}[?]{} Do you want to remove container(s) or image(s) [C/i]? ".format(BOLD_BLUE, END)).lower()
+    if to_remove in ("c", ""):
         remove_container()
-    elif to_remove.lower() == "i":
+    elif to_remove == "i":
         remove_image()
     else:
         logger.warning("Invalid choice")
@@ -819,26 +849,27 @@ def info_images():
         notinstalled_remote_images = remote_images
         logger.debug("Fetching local image tags, digests (and other attributes)")
         local_images_list = client.images.list(IMAGE_NAME, filters={"dangling": False})
+        repo_digest_prefix = "{}@".format(IMAGE_NAME)
         for image in local_images_list:
-            id = image.attrs["Id"].split(":")[1][:12]
-            if not image.attrs["RepoTags"]:
+            attrs = image.attrs
+            id = attrs["Id"].partition(":")[2][:12]
+            real_size = readable_size(attrs["Size"])
+            repo_tags = attrs["RepoTags"]
+            if not repo_tags:
                 # TODO: investigate this, print those images as "layers"
                 #  these are layers for other images
-                real_size = readable_size(image.attrs["Size"])
-                digest = image.attrs["Id"].replace("sha256:", "")
                 images.append([id, "<none>", real_size, "local layer"])
             else:
-                name, tag = image.attrs["RepoTags"][0].split(':')
-                real_size = readable_size(image.attrs["Size"])
+                name, _, tag = repo_tags[0].rpartition(':')
+                repo_digests = attrs["RepoDigests"]
 
-                if image.attrs["RepoDigests"]:  # If true, the image was pulled instead of built
-                    digest = image.attrs["RepoDigests"][0].replace("{}@".format(IMAGE_NAME), "")
+                if repo_digests:  # If true, the image was pulled instead of built
+                    digest = repo_digests[0].replace(repo_digest_prefix, "")
 
                     logger.debug("└── {} → {}...".format(tag, digest[:32]))
                     if digest in remote_images.keys():
-                        images.append([id, tag, real_size, "remote ({}, {})".format("[green]up to date[/green]",
-                                                                                    remote_images[digest][
-                                                                                        "compressed_size"])])
+                        images.append([id, tag, real_size,
+                                       IMAGE_UP_TO_DATE.format(remote_images[digest]["compressed_size"])])
                         notinstalled_remote_images.pop(digest)
                     else:
                         for key in remote_images:
@@ -849,20 +880,17 @@ def info_images():
                                 remote_digest = ""
                         if remote_digest:
                             compressed_size = remote_images[remote_digest]["compressed_size"]
-                            images.append([id, tag, real_size,
-                                           "remote ({}, {})".format("[orange3]deprecated[/orange3]", compressed_size)])
+                            images.append([id, tag, real_size, IMAGE_DEPRECATED.format(compressed_size)])
                             notinstalled_remote_images.pop(remote_digest)
                         else:
-                            images.append([id, tag, real_size, "remote ({})".format("[bright_black]discontinued["
-                                                                                    "/bright_black]")])
+                            images.append([id, tag, real_size, IMAGE_DISCONTINUED])
                 else:
                     images.append([id, tag, real_size, "local image"])
         for uninstalled_remote_image in notinstalled_remote_images.items():
             tag = uninstalled_remote_image[1]["tag"]
             compressed_size = uninstalled_remote_image[1]["compressed_size"]
-            id = uninstalled_remote_image[0].split(":")[1][:12]
-            images.append([id, tag, "[bright_black]N/A[/bright_black]",
-                           "remote ({}, {})".format("[yellow3]not installed[/yellow3]", compressed_size)])
+            id = uninstalled_remote_image[0].partition(":")[2][:12]
+            images.append([id, tag, "[bright_black]N/A[/bright_black]", IMAGE_NOT_INSTALLED.format(compressed_size)])
         images = sorted(images, key=lambda k: k[1])
         if options.verbosity == 0:
             table = Table(show_header=True, header_style="bold blue", border_style="blue", box=box.SIMPLE)
@@ -888,39 +916,36 @@ def info_images():
 
 
 def info_containers():
-    len_containers = len(client.containers.list(all=True, filters={"name": "exegol-"}))
+    local_containers = client.containers.list(all=True, filters={"name": "exegol-"})
+    len_containers = len(local_containers)
     if len_containers > 0:
         logger.info("Available local containers: {}".format(len_containers))
         containers = []
-        for container in client.containers.list(all=True, filters={"name": "exegol-"}):
-            id = container.attrs["Id"][:12]
-            tag = container.attrs["Name"].replace('/exegol-', '')
-            state = container.attrs["State"]["Status"]
+        for container in local_containers:
+            attrs = container.attrs
+            id = attrs["Id"][:12]
+            tag = attrs["Name"].replace('/exegol-', '')
+            state = attrs["State"]["Status"]
             if state == "running":
-                state = "[green]" + state + "[/green]"
-            image = container.attrs["Config"]["Image"]
+                state = RUNNING_STATE
+            image = attrs["Config"]["Image"]
             logger.debug("Fetching details on containers creation")
             details = []
             if was_created_with_gui(container):
                 details.append("--X11")
             if was_created_with_host_networking(container):
                 details.append("--host-network")
-            if was_created_with_device(container):
-                details.append("--device {}".format(was_created_with_device(container)))
+            device = was_created_with_device(container)
+            if device:
+                details.append("--device {}".format(device))
             if was_created_with_privileged(container):
                 details.append("[orange3]--privileged[/orange3]")
             details = " ".join(details)
-            logger.debug("Fetching volumes for each container")
             volumes = ""
-            if "Binds" in container.attrs["HostConfig"].keys():
-                for bind in container.attrs["HostConfig"]["Binds"]:
-                    volumes += bind.replace(":", " ↔ ") + "\n"
-            if "Mounts" in container.attrs["HostConfig"].keys():
-                for mount in container.attrs["HostConfig"]["Mounts"]:
-                    volumes += mount["VolumeOptions"]["DriverConfig"]["Options"]["device"]
-                    volumes += " ↔ "
-                    volumes += mount["Target"]
-                    volumes += "\n"
+            # binds & mounts are only displayed in verbose mode
+            if options.verbosity >= 1:
+                logger.debug("Fetching volumes for each container")
+                volumes = "".join(volume + "\n" for _, volume in get_container_volumes(attrs["HostConfig"]))
             containers.append([id, tag, state, image, details, volumes])
         if options.verbosity == 0:
             table = Table(show_header=True, header_style="bold blue", border_style="blue", box=box.SIMPLE)
@@ -974,11 +999,7 @@ def exec():
         if container_exists(options.containertag):
             if LOOP_PREVENTION == "" or LOOP_PREVENTION == "create":
                 logger.success("Container exists")
-            containers = client.containers.list(all=True, filters={"name": "exegol-" + options.containertag})
-            for container in containers:
-                if not container.name == "exegol-" + options.containertag:
-                    containers.remove(container)
-            container = containers[0]
+            container = get_containers(options.containertag)[0]
             if container.attrs["State"]["Status"] == "running":
                 if LOOP_PREVENTION == "exec":
                     logger.debug("Loop prevention triggered")
@@ -988,13 +1009,7 @@ def exec():
                     container_analysis(container)
                     if was_created_with_gui(container):
                         logger.info("Running xhost command for display sharing")
-                        exec_popen(
-                            "xhost +local:{}".format(
-                                client.api.inspect_container("exegol-" + options.containertag)["Config"][
-                                    "Hostname"
-                                ]
-                            )
-                        )
+                        exec_popen("xhost +local:{}".format(container.attrs["Config"]["Hostname"]))
                     logger.info("Executing command on Exegol as daemon")
                     # Using 'zsh source /opt/.zsh_aliases; eval cmd' to interpret alias commands on a non-interactive shell
                     cmd = "zsh -c \"source /opt/.zsh_aliases; eval \'{}\'\"".format(options.exec.replace("\"", "\\\"").replace("\'", "\\\'"))
@@ -1018,15 +1033,11 @@ def exec():
             else:
                 logger.warning("Container does not exist")
                 info_images()
-                if LOCAL_GIT_BRANCH == "master":  # TODO: fix this crap when I'll have branch names that are equal to docker tags
-                    default_dockertag = "stable"
-                else:
-                    default_dockertag = LOCAL_GIT_BRANCH
                 imagetag = input(
                     "{}[?]{} What image do you want the container to create to be based upon [default: {}]? ".format(
-                        BOLD_BLUE, END, default_dockertag))
+                        BOLD_BLUE, END, DEFAULT_DOCKERTAG))
                 if not imagetag:
-                    imagetag = default_dockertag
+                    imagetag = DEFAULT_DOCKERTAG
                 if client.images.list(IMAGE_NAME + ":" + imagetag):
                     info_containers()
                     if options.containertag:
@@ -1067,7 +1078,7 @@ def exec():
                     BOLD_ORANGE, END
                 )
             )
-            if confirmation == "y" or confirmation == "yes" or confirmation == "Y":
+            if confirmation in CONFIRMATION_ANSWERS:
                 install()
                 LOOP_PREVENTION = "install"
                 exec()
@@ -1130,6 +1141,10 @@ if __name__ == "__main__":
         LOCAL_GIT_BRANCH = "master"
     else:
         logger.debug("Local git branch: {}".format(LOCAL_GIT_BRANCH))
+    if LOCAL_GIT_BRANCH == "master":  # TODO: fix this crap when I'll have branch names that are equal to docker tags
+        DEFAULT_DOCKERTAG = "stable"
+    else:
+        DEFAULT_DOCKERTAG = LOCAL_GIT_BRANCH
 
     EXEGOL_PATH = os.path.dirname(os.path.realpath(__file__))
 